@@ -3,24 +3,17 @@
 from dataclasses import dataclass, field
 from typing import Any, Optional, Union
 
-from dataclasses_json import LetterCase, dataclass_json
+from dataclasses_json import dataclass_json
 
 import adaptive_cards.card_types as ct
 from adaptive_cards import utils
 
-ActionTypes = Union[
-    "ActionOpenUrl",
-    "ActionSubmit",
-    "ActionShowCard",
-    "ActionToggleVisibility",
-    "ActionExecute",
-]
-SelectAction = Union[
-    "ActionExecute", "ActionOpenUrl", "ActionSubmit", "ActionToggleVisibility"
-]
 
+def _decode_action(value: Any) -> Any:
+    return utils.decode_tagged(value, ActionTypes)
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
+
+@dataclass_json(letter_case=utils.camel_case)
 @dataclass(kw_only=True)
 class Action:
     # pylint: disable=too-many-instance-attributes
@@ -47,8 +40,8 @@ class Action:
     style: Optional[ct.ActionStyle] = field(
         default=None, metadata=utils.get_metadata("1.2")
     )
-    fallback: Optional[ActionTypes] = field(
-        default=None, metadata=utils.get_metadata("1.2")
+    fallback: Optional["ActionTypes"] = field(
+        default=None, metadata=utils.get_metadata("1.2", decoder=_decode_action)
     )
     tooltip: Optional[str] = field(default=None, metadata=utils.get_metadata("1.5"))
     is_enabled: Optional[bool] = field(default=None, metadata=utils.get_metadata("1.5"))
@@ -60,7 +53,7 @@ class Action:
     )
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
+@dataclass_json(letter_case=utils.camel_case)
 @dataclass(kw_only=True)
 class ActionOpenUrl(Action):
     """
@@ -77,7 +70,7 @@ class ActionOpenUrl(Action):
     type: str = field(default="Action.OpenUrl", metadata=utils.get_metadata("1.0"))
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
+@dataclass_json(letter_case=utils.camel_case)
 @dataclass(kw_only=True)
 class ActionSubmit(Action):
     """
@@ -98,7 +91,7 @@ class ActionSubmit(Action):
     )
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
+@dataclass_json(letter_case=utils.camel_case)
 @dataclass(kw_only=True)
 class ActionShowCard(Action):
     """
@@ -115,8 +108,8 @@ class ActionShowCard(Action):
     card: Optional[Any] = field(default=None, metadata=utils.get_metadata("1.0"))
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass(kw_only=True)
+@dataclass_json(letter_case=utils.camel_case)
+@dataclass(kw_only=True, slots=True)
 class TargetElement:
     """
     Represents a target element.
@@ -130,7 +123,7 @@ class TargetElement:
     is_visible: Optional[bool] = field(default=None, metadata=utils.get_metadata("1.0"))
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
+@dataclass_json(letter_case=utils.camel_case)
 @dataclass(kw_only=True)
 class ActionToggleVisibility(Action):
     """
@@ -149,7 +142,7 @@ class ActionToggleVisibility(Action):
     )
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
+@dataclass_json(letter_case=utils.camel_case)
 @dataclass(kw_only=True)
 class ActionExecute(Action):
     """
@@ -158,7 +151,7 @@ class ActionExecute(Action):
     Inherits from Action.
 
     Attributes:
-        type: The type of the action, set to "Action.ShowCard".
+        type: The type of the action, set to "Action.Execute".
         verb: An optional string representing the verb of the action.
         data: An optional string or Any type representing additional data associated
         with the action.
@@ -166,9 +159,21 @@ class ActionExecute(Action):
         inputs for the action.
     """
 
-    type: str = field(default="Action.ShowCard", metadata=utils.get_metadata("1.4"))
+    type: str = field(default="Action.Execute", metadata=utils.get_metadata("1.4"))
     verb: Optional[str] = field(default=None, metadata=utils.get_metadata("1.4"))
     data: Optional[str | Any] = field(default=None, metadata=utils.get_metadata("1.4"))
     associated_inputs: Optional[ct.AssociatedInputs] = field(
         default=None, metadata=utils.get_metadata("1.4")
     )
+
+
+# The union types are defined once all of their classes are, so modules importing
+# them get the actual classes. Annotations above refer to them by name.
+ActionTypes = Union[
+    ActionOpenUrl,
+    ActionSubmit,
+    ActionShowCard,
+    ActionToggleVisibility,
+    ActionExecute,
+]
+SelectAction = Union[ActionExecute, ActionOpenUrl, ActionSubmit, ActionToggleVisibility]
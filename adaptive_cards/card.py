@@ -1,9 +1,19 @@
 """Implementation of the adaptive card type"""
 
+from collections.abc import Collection, Mapping
 from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
 from typing import Any, Literal, Optional, Sequence
+from uuid import UUID
 
-from dataclasses_json import LetterCase, dataclass_json
+from dataclasses_json import DataClassJsonMixin, config
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 import adaptive_cards.card_types as ct
 from adaptive_cards import utils
@@ -18,9 +28,39 @@ CardVersion = Literal["1.0", "1.1", "1.2", "1.3", "1.4", "1.5", "1.6"]
 VERSION: CardVersion = "1.0"
 
 
+def _decode_items(value: Any) -> Any:
+    return utils.decode_tagged(value, Element, ContainerTypes, InputTypes)
+
+
+def _encode_json_default(value: Any) -> Any:
+    # encodes values the same way as the json encoder of dataclasses_json
+    if isinstance(value, Collection):
+        return dict(value) if isinstance(value, Mapping) else list(value)
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Decimal):
+        return str(value)
+
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _decode_action(value: Any) -> Any:
+    return utils.decode_tagged(value, ActionTypes)
+
+
+def _decode_select_action(value: Any) -> Any:
+    return utils.decode_tagged(value, SelectAction)
+
+
 class AdaptiveCardBuilder:
     """Builder class for creating adaptive cards dynamically"""
 
+    __slots__ = ("__card",)
+
     def __init__(self) -> None:
         self.__reset()
 
@@ -229,7 +269,9 @@ class AdaptiveCardBuilder:
             AdaptiveCardBuilder: Builder object
         """
         if width == ct.MSTeamsCardWidth.FULL:
-            self.__card.msteams = ct.MSTeams(width=width)
+            msteams: Optional[ct.MSTeams] = self.__card.msteams
+            if msteams is None or msteams.width != width:
+                self.__card.msteams = ct.MSTeams(width=width)
             return self
 
         self.__card.msteams = None
@@ -266,9 +308,7 @@ class AdaptiveCardBuilder:
         """
         if self.__card.body is None:
             self.__card.body = []
-        for item in items:
-            self.add_item(item)
-
+        self.__card.body.extend(items)
         return self
 
     def add_action(self, action: ActionTypes) -> "AdaptiveCardBuilder":
@@ -298,9 +338,7 @@ class AdaptiveCardBuilder:
         """
         if self.__card.actions is None:
             self.__card.actions = []
-        for action in actions:
-            self.add_action(action)
-
+        self.__card.actions.extend(actions)
         return self
 
     def create(self) -> "AdaptiveCard":
@@ -308,17 +346,20 @@ class AdaptiveCardBuilder:
         Create final card object.
 
         Please note: This method must be called to get a actual card object from the card builder.
+        The builder hands over its card and starts a new one, so it can be reused without
+        changing cards created before.
 
         Returns:
             AdaptiveCard: Fully defined apdative card object
         """
-        return self.__card
+        card: AdaptiveCard = self.__card
+        self.__reset()
+        return card
 
 
 # pylint: disable=too-many-instance-attributes
-@dataclass_json(letter_case=LetterCase.CAMEL)
 @dataclass
-class AdaptiveCard:
+class AdaptiveCard(DataClassJsonMixin):
     """
     Represents an Adaptive Card.
 
@@ -342,6 +383,8 @@ class AdaptiveCard:
         msteams: Set specific properties for MS Teams as the target framework
     """
 
+    dataclass_json_config = config(letter_case=utils.camel_case)["dataclasses_json"]
+
     type: str = field(default=TYPE, metadata=utils.get_metadata("1.0"))
     version: str = field(default=VERSION, metadata=utils.get_metadata("1.0"))
     schema: str = field(
@@ -354,13 +397,13 @@ class AdaptiveCard:
         default=None, metadata=utils.get_metadata("1.4")
     )
     body: Optional[list[Element | ContainerTypes | InputTypes]] = field(
-        default=None, metadata=utils.get_metadata("1.0")
+        default=None, metadata=utils.get_metadata("1.0", decoder=_decode_items)
     )
     actions: Optional[list[ActionTypes]] = field(
-        default=None, metadata=utils.get_metadata("1.0")
+        default=None, metadata=utils.get_metadata("1.0", decoder=_decode_action)
     )
     select_action: Optional[SelectAction] = field(
-        default=None, metadata=utils.get_metadata("1.1")
+        default=None, metadata=utils.get_metadata("1.1", decoder=_decode_select_action)
     )
     fallback_text: Optional[str] = field(
         default=None, metadata=utils.get_metadata("1.0")
@@ -393,21 +436,60 @@ class AdaptiveCard:
         """
         return AdaptiveCardBuilder()
 
-    def to_json(self) -> str:
+    def to_json(self, **kwargs: Any) -> str:
         """
         Converts the full adaptive card schema into a json string.
 
+        Args:
+            **kwargs (Any): Options passed to `json.dumps`, like `indent`.
+
         Returns:
             str: Adaptive card schema as JSON string.
         """
-        return self.to_json()
+        return super().to_json(**kwargs)
 
-    def to_dict(self) -> dict[str, Any]:
+    def to_json_bytes(self) -> bytes:
+        """
+        Converts the full adaptive card schema into a compact, UTF-8 encoded json
+        string. If `orjson` is installed, it is used for encoding, which avoids
+        creating an intermediate `str` object. Datetimes, decimals and collections
+        in submit data are converted like by `to_json`, and cards `orjson` fails to
+        encode, e.g. due to integers beyond 64 bit, are encoded by `to_json`.
+        Unlike `to_json`, `orjson` encodes NaN and infinite floats as `null`.
+
+        Returns:
+            bytes: Adaptive card schema as UTF-8 encoded JSON.
+        """
+        if orjson is not None:
+            try:
+                return orjson.dumps(
+                    self.to_dict(),
+                    default=_encode_json_default,
+                    option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+                )
+
+            except orjson.JSONEncodeError:
+                pass
+
+        return self.to_json(separators=(",", ":")).encode("utf-8")
+
+    def to_dict(self, encode_json: bool = False) -> dict[str, Any]:
         """
         Converts the full adaptive card schema into a dictionary.
 
+        Args:
+            encode_json (bool): Whether values should be encoded to JSON compatible
+                                types.
+
         Returns:
-            str: Adaptive card schema as dictionary.
+            dict[str, Any]: Adaptive card schema as dictionary.
         """
+        if encode_json:
+            return super().to_dict(encode_json=True)
+
+        return utils.serialize(self)
+
 
-        return self.to_dict()
+# The `schema` field shadows the `schema()` classmethod of the mixin, hence rebind
+# it the same way `dataclass_json` does for decorated classes.
+AdaptiveCard.schema = classmethod(DataClassJsonMixin.schema.__func__)  # type: ignore
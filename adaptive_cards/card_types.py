@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional
 
-from dataclasses_json import LetterCase, dataclass_json
+from dataclasses_json import dataclass_json
 
 from adaptive_cards import utils
 
@@ -319,8 +319,8 @@ class ChoiceInputStyle(str, Enum):
     FILTERED = "filtered"
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass(kw_only=True)
+@dataclass_json(letter_case=utils.camel_case)
+@dataclass(kw_only=True, slots=True)
 class BackgroundImage:
     """
     Represents the background image properties.
@@ -344,8 +344,8 @@ class BackgroundImage:
     )
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass(kw_only=True)
+@dataclass_json(letter_case=utils.camel_case)
+@dataclass(kw_only=True, slots=True)
 class Refresh:
     """
     Represents the refresh properties.
@@ -363,8 +363,8 @@ class Refresh:
     )
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass(kw_only=True)
+@dataclass_json(letter_case=utils.camel_case)
+@dataclass(kw_only=True, slots=True)
 class TokenExchangeResource:
     """
     Represents a token exchange resource.
@@ -380,8 +380,8 @@ class TokenExchangeResource:
     provider_id: str = field(default="", metadata=utils.get_metadata("1.4"))
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass(kw_only=True)
+@dataclass_json(letter_case=utils.camel_case)
+@dataclass(kw_only=True, slots=True)
 class AuthCardButtons:
     """
     Represents buttons used in an authentication card.
@@ -399,8 +399,8 @@ class AuthCardButtons:
     image: Optional[str] = field(default=None, metadata=utils.get_metadata("1.4"))
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass(kw_only=True)
+@dataclass_json(letter_case=utils.camel_case)
+@dataclass(kw_only=True, slots=True)
 class Authentication:
     """
     Represents authentication properties.
@@ -424,8 +424,8 @@ class Authentication:
     )
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass(kw_only=True)
+@dataclass_json(letter_case=utils.camel_case)
+@dataclass(kw_only=True, slots=True)
 class Metadata:
     """
     Represents metadata properties.
@@ -437,8 +437,8 @@ class Metadata:
     web_url: Optional[str] = field(default=None, metadata=utils.get_metadata("1.6"))
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass(kw_only=True)
+@dataclass_json(letter_case=utils.camel_case)
+@dataclass(kw_only=True, slots=True)
 class MSTeams:
     """
     Represents specific properties for MS Teams as the target framework.
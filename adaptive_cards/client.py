@@ -7,13 +7,13 @@
 """  # pylint: disable=line-too-long
 
 from http import HTTPStatus
-from typing import Any
-
-import requests
-from requests import Response
+from typing import TYPE_CHECKING, Any
 
 from adaptive_cards.card import AdaptiveCard
 
+if TYPE_CHECKING:
+    from requests import Response
+
 
 class TeamsClient:
     """Client class for sending adaptive card objects to MS Teams via webhooks"""
@@ -58,7 +58,7 @@ class TeamsClient:
         """
         self._webhook_url = webhook_url
 
-    def send(self, *cards: AdaptiveCard, timeout: int = 1000) -> Response:
+    def send(self, *cards: AdaptiveCard, timeout: int = 1000) -> "Response":
         """
         Send the payload of one or multiple cards to a via Microsoft Teams webhook.
 
@@ -78,6 +78,10 @@ class TeamsClient:
         if not cards:
             raise ValueError("No cards provided.")
 
+        # importing requests takes a considerable amount of time, hence it is
+        # deferred until a card is sent for the first time
+        import requests  # pylint: disable=import-outside-toplevel
+
         headers = {"Content-Type": "application/json"}
         attachments = [self._create_attachment(card) for card in cards]
         payload = {"type": "message", "attachments": attachments}
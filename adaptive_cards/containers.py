@@ -1,20 +1,40 @@
 """Implementations for all adaptive card container types"""
 
 from dataclasses import dataclass, field
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
-from dataclasses_json import LetterCase, dataclass_json
+from dataclasses_json import dataclass_json
 
 import adaptive_cards.actions as action
 import adaptive_cards.card_types as ct
 from adaptive_cards import elements, inputs, utils
 
-ContainerTypes = Union[
-    "ActionSet", "Container", "ColumnSet", "FactSet", "ImageSet", "Table"
-]
 
+def _decode_fallback(value: Any) -> Any:
+    return utils.decode_tagged(
+        value, elements.Element, action.ActionTypes, inputs.InputTypes
+    )
+
+
+def _decode_action(value: Any) -> Any:
+    return utils.decode_tagged(value, action.ActionTypes)
+
+
+def _decode_select_action(value: Any) -> Any:
+    return utils.decode_tagged(value, action.SelectAction)
+
+
+def _decode_items(value: Any) -> Any:
+    return utils.decode_tagged(
+        value, elements.Element, ContainerTypes, inputs.InputTypes
+    )
+
+
+def _decode_elements(value: Any) -> Any:
+    return utils.decode_tagged(value, elements.Element)
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
+
+@dataclass_json(letter_case=utils.camel_case)
 @dataclass(kw_only=True)
 class ContainerBase:
     """
@@ -33,7 +53,9 @@ class ContainerBase:
     """
 
     fallback: Optional[elements.Element | action.ActionTypes | inputs.InputTypes] = (
-        field(default=None, metadata=utils.get_metadata("1.2"))
+        field(
+            default=None, metadata=utils.get_metadata("1.2", decoder=_decode_fallback)
+        )
     )
     separator: Optional[bool] = field(default=None, metadata=utils.get_metadata("1.2"))
     spacing: Optional[ct.Spacing] = field(
@@ -50,7 +72,7 @@ class ContainerBase:
     )
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
+@dataclass_json(letter_case=utils.camel_case)
 @dataclass(kw_only=True)
 class ActionSet(ContainerBase):
     """Represents an action set, a container for a list of actions.
@@ -62,11 +84,13 @@ class ActionSet(ContainerBase):
         type: The type of the action set. Defaults to "ActionSet".
     """
 
-    actions: list[action.ActionTypes] = field(metadata=utils.get_metadata("1.2"))
+    actions: list[action.ActionTypes] = field(
+        metadata=utils.get_metadata("1.2", decoder=_decode_action)
+    )
     type: str = field(default="ActionSet", metadata=utils.get_metadata("1.2"))
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
+@dataclass_json(letter_case=utils.camel_case)
 @dataclass(kw_only=True)
 class Container(ContainerBase):
     # pylint: disable=too-many-instance-attributes
@@ -86,12 +110,12 @@ class Container(ContainerBase):
         rtl: Determines whether the container's content is displayed right-to-left.
     """
 
-    items: list[elements.Element | ContainerTypes | inputs.InputTypes] = field(
-        metadata=utils.get_metadata("1.0")
+    items: list[elements.Element | "ContainerTypes" | inputs.InputTypes] = field(
+        metadata=utils.get_metadata("1.0", decoder=_decode_items)
     )
     type: str = field(default="Container", metadata=utils.get_metadata("1.0"))
     select_action: Optional[action.SelectAction] = field(
-        default=None, metadata=utils.get_metadata("1.1")
+        default=None, metadata=utils.get_metadata("1.1", decoder=_decode_select_action)
     )
     style: Optional[ct.ContainerStyle] = field(
         default=None, metadata=utils.get_metadata("1.0")
@@ -107,41 +131,7 @@ class Container(ContainerBase):
     rtl: Optional[bool] = field(default=None, metadata=utils.get_metadata("1.5"))
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass(kw_only=True)
-class ColumnSet(ContainerBase):
-    """Represents a set of columns within a container.
-
-    Inherits from ContainerBase.
-
-    Attributes:
-        type: The type of the column set. Defaults to "ColumnSet".
-        columns: An optional list of Column objects within the column set.
-        select_action: An optional select action associated with the column set.
-        style: The style of the column set.
-        bleed: Determines whether the column set bleeds beyond its boundary.
-        min_height: The minimum height of the column set.
-        horizontal_alignment: The horizontal alignment of the column set.
-    """
-
-    type: str = field(default="ColumnSet", metadata=utils.get_metadata("1.0"))
-    columns: Optional[list["Column"]] = field(
-        default=None, metadata=utils.get_metadata("1.0")
-    )
-    select_action: Optional[action.SelectAction] = field(
-        default=None, metadata=utils.get_metadata("1.1")
-    )
-    style: Optional[ct.ContainerStyle] = field(
-        default=None, metadata=utils.get_metadata("1.2")
-    )
-    bleed: Optional[bool] = field(default=None, metadata=utils.get_metadata("1.2"))
-    min_height: Optional[str] = field(default=None, metadata=utils.get_metadata("1.2"))
-    horizontal_alignment: Optional[ct.HorizontalAlignment] = field(
-        default=None, metadata=utils.get_metadata("1.0")
-    )
-
-
-@dataclass_json(letter_case=LetterCase.CAMEL)
+@dataclass_json(letter_case=utils.camel_case)
 @dataclass(kw_only=True)
 class Column(ContainerBase):
     # pylint: disable=too-many-instance-attributes
@@ -165,8 +155,8 @@ class Column(ContainerBase):
     """
 
     type: str = field(default="Column", metadata=utils.get_metadata("1.0"))
-    items: Optional[list[elements.Element | ContainerTypes | inputs.Input]] = field(
-        default=None, metadata=utils.get_metadata("1.0")
+    items: Optional[list[elements.Element | "ContainerTypes" | inputs.Input]] = field(
+        default=None, metadata=utils.get_metadata("1.0", decoder=_decode_items)
     )
     background_image: Optional[ct.BackgroundImage | str] = field(
         default=None, metadata=utils.get_metadata("1.2")
@@ -179,7 +169,7 @@ class Column(ContainerBase):
         default=None, metadata=utils.get_metadata("1.0")
     )
     select_action: Optional[action.SelectAction] = field(
-        default=None, metadata=utils.get_metadata("1.1")
+        default=None, metadata=utils.get_metadata("1.1", decoder=_decode_select_action)
     )
     style: Optional[ct.ContainerStyle] = field(
         default=None, metadata=utils.get_metadata("1.0")
@@ -190,24 +180,42 @@ class Column(ContainerBase):
     width: Optional[str | int] = field(default=None, metadata=utils.get_metadata("1.0"))
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
+@dataclass_json(letter_case=utils.camel_case)
 @dataclass(kw_only=True)
-class FactSet(ContainerBase):
-    """Represents a set of facts within a container.
+class ColumnSet(ContainerBase):
+    """Represents a set of columns within a container.
 
     Inherits from ContainerBase.
 
     Attributes:
-        facts: A list of Fact objects within the fact set.
-        type: The type of the fact set. Defaults to "FactSet".
+        type: The type of the column set. Defaults to "ColumnSet".
+        columns: An optional list of Column objects within the column set.
+        select_action: An optional select action associated with the column set.
+        style: The style of the column set.
+        bleed: Determines whether the column set bleeds beyond its boundary.
+        min_height: The minimum height of the column set.
+        horizontal_alignment: The horizontal alignment of the column set.
     """
 
-    facts: list["Fact"] = field(metadata=utils.get_metadata("1.0"))
-    type: str = field(default="FactSet", metadata=utils.get_metadata("1.0"))
+    type: str = field(default="ColumnSet", metadata=utils.get_metadata("1.0"))
+    columns: Optional[list[Column]] = field(
+        default=None, metadata=utils.get_metadata("1.0")
+    )
+    select_action: Optional[action.SelectAction] = field(
+        default=None, metadata=utils.get_metadata("1.1", decoder=_decode_select_action)
+    )
+    style: Optional[ct.ContainerStyle] = field(
+        default=None, metadata=utils.get_metadata("1.2")
+    )
+    bleed: Optional[bool] = field(default=None, metadata=utils.get_metadata("1.2"))
+    min_height: Optional[str] = field(default=None, metadata=utils.get_metadata("1.2"))
+    horizontal_alignment: Optional[ct.HorizontalAlignment] = field(
+        default=None, metadata=utils.get_metadata("1.0")
+    )
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass(kw_only=True)
+@dataclass_json(letter_case=utils.camel_case)
+@dataclass(kw_only=True, slots=True)
 class Fact:
     """Represents a fact.
 
@@ -220,7 +228,23 @@ class Fact:
     value: str = field(metadata=utils.get_metadata("1.0"))
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
+@dataclass_json(letter_case=utils.camel_case)
+@dataclass(kw_only=True)
+class FactSet(ContainerBase):
+    """Represents a set of facts within a container.
+
+    Inherits from ContainerBase.
+
+    Attributes:
+        facts: A list of Fact objects within the fact set.
+        type: The type of the fact set. Defaults to "FactSet".
+    """
+
+    facts: list[Fact] = field(metadata=utils.get_metadata("1.0"))
+    type: str = field(default="FactSet", metadata=utils.get_metadata("1.0"))
+
+
+@dataclass_json(letter_case=utils.camel_case)
 @dataclass(kw_only=True)
 class ImageSet(ContainerBase):
     """Represents a set of images within a container.
@@ -240,8 +264,8 @@ class ImageSet(ContainerBase):
     )
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass(kw_only=True)
+@dataclass_json(letter_case=utils.camel_case)
+@dataclass(kw_only=True, slots=True)
 class TableColumnDefinition:
     """Represents a definition for a table column.
 
@@ -260,8 +284,46 @@ class TableColumnDefinition:
     width: Optional[str | int] = field(default=None, metadata=utils.get_metadata("1.5"))
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass(kw_only=True)
+@dataclass_json(letter_case=utils.camel_case)
+@dataclass(kw_only=True, slots=True)
+class TableCell:
+    # pylint: disable=too-many-instance-attributes
+    """Represents a cell within a table.
+
+    Attributes:
+        items: The elements within the cell.
+        select_action: The action to perform when the cell is selected.
+        style: The style of the cell.
+        vertical_content_alignment: The vertical alignment of cell content.
+        bleed: Whether the cell should bleed beyond its boundaries.
+        background_image: The background image of the cell.
+        min_height: The minimum height of the cell.
+        rtl: Whether the cell should be rendered in right-to-left direction.
+    """
+
+    type: str = field(default="TableCell", metadata=utils.get_metadata("1.5"))
+    items: list[elements.Element] = field(
+        metadata=utils.get_metadata("1.5", decoder=_decode_elements)
+    )
+    select_action: Optional[action.SelectAction] = field(
+        default=None, metadata=utils.get_metadata("1.1", decoder=_decode_select_action)
+    )
+    style: Optional[ct.ContainerStyle] = field(
+        default=None, metadata=utils.get_metadata("1.5")
+    )
+    vertical_content_alignment: Optional[ct.VerticalAlignment] = field(
+        default=None, metadata=utils.get_metadata("1.1")
+    )
+    bleed: Optional[bool] = field(default=None, metadata=utils.get_metadata("1.2"))
+    background_image: Optional[ct.BackgroundImage | str] = field(
+        default=None, metadata=utils.get_metadata("1.2")
+    )
+    min_height: Optional[str] = field(default=None, metadata=utils.get_metadata("1.2"))
+    rtl: Optional[bool] = field(default=None, metadata=utils.get_metadata("1.5"))
+
+
+@dataclass_json(letter_case=utils.camel_case)
+@dataclass(kw_only=True, slots=True)
 class TableRow:
     """Represents a row within a table.
 
@@ -273,7 +335,7 @@ class TableRow:
     """
 
     type: str = field(default="TableRow", metadata=utils.get_metadata("1.5"))
-    cells: Optional["TableCell"] = field(
+    cells: Optional[list[TableCell]] = field(
         default=None, metadata=utils.get_metadata("1.5")
     )
     horizontal_cell_content_alignment: Optional[ct.HorizontalAlignment] = field(
@@ -285,7 +347,7 @@ class TableRow:
     style: Optional[str] = field(default=None, metadata=utils.get_metadata("1.5"))
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
+@dataclass_json(letter_case=utils.camel_case)
 @dataclass(kw_only=True)
 class Table(ContainerBase):
     # pylint: disable=too-many-instance-attributes
@@ -328,37 +390,5 @@ class Table(ContainerBase):
     )
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass(kw_only=True)
-class TableCell:
-    # pylint: disable=too-many-instance-attributes
-    """Represents a cell within a table.
-
-    Attributes:
-        items: The elements within the cell.
-        select_action: The action to perform when the cell is selected.
-        style: The style of the cell.
-        vertical_content_alignment: The vertical alignment of cell content.
-        bleed: Whether the cell should bleed beyond its boundaries.
-        background_image: The background image of the cell.
-        min_height: The minimum height of the cell.
-        rtl: Whether the cell should be rendered in right-to-left direction.
-    """
-
-    type: str = field(default="TableCell", metadata=utils.get_metadata("1.5"))
-    items: list[elements.Element] = field(metadata=utils.get_metadata("1.5"))
-    select_action: Optional[action.SelectAction] = field(
-        default=None, metadata=utils.get_metadata("1.1")
-    )
-    style: Optional[ct.ContainerStyle] = field(
-        default=None, metadata=utils.get_metadata("1.5")
-    )
-    vertical_content_alignment: Optional[ct.VerticalAlignment] = field(
-        default=None, metadata=utils.get_metadata("1.1")
-    )
-    bleed: Optional[bool] = field(default=None, metadata=utils.get_metadata("1.2"))
-    background_image: Optional[ct.BackgroundImage | str] = field(
-        default=None, metadata=utils.get_metadata("1.2")
-    )
-    min_height: Optional[str] = field(default=None, metadata=utils.get_metadata("1.2"))
-    rtl: Optional[bool] = field(default=None, metadata=utils.get_metadata("1.5"))
+# The union type is defined once all of its classes are (see `actions.ActionTypes`).
+ContainerTypes = Union[ActionSet, Container, ColumnSet, FactSet, ImageSet, Table]
@@ -2,16 +2,22 @@
 
 from dataclasses import dataclass, field
 from typing import Union, Optional, Any
-from dataclasses_json import LetterCase, dataclass_json
+from dataclasses_json import dataclass_json
 
 from adaptive_cards import actions
 from adaptive_cards import utils
 import adaptive_cards.card_types as ct
 
-Element = Union["Image", "TextBlock", "Media", "CaptionSource", "RichTextBlock"]
 
+def _decode_select_action(value: Any) -> Any:
+    return utils.decode_tagged(value, actions.SelectAction)
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
+
+def _decode_inlines(value: Any) -> Any:
+    return utils.decode_tagged(value, TextRun)
+
+
+@dataclass_json(letter_case=utils.camel_case)
 @dataclass(kw_only=True)
 class CardElement:
     """
@@ -27,7 +33,7 @@ class CardElement:
         height: The height of the element.
     """
 
-    element: Optional[Any | Element] = field(
+    element: Optional[Union[Any, "Element"]] = field(
         default=None, metadata=utils.get_metadata("1.2")
     )
     separator: Optional[bool] = field(default=None, metadata=utils.get_metadata("1.0"))
@@ -44,7 +50,7 @@ class CardElement:
     )
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
+@dataclass_json(letter_case=utils.camel_case)
 @dataclass(kw_only=True)
 class TextBlock(CardElement):
     # pylint: disable=too-many-instance-attributes
@@ -90,7 +96,7 @@ class TextBlock(CardElement):
     )
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
+@dataclass_json(letter_case=utils.camel_case)
 @dataclass(kw_only=True)
 class Image(CardElement):
     # pylint: disable=too-many-instance-attributes
@@ -121,7 +127,7 @@ class Image(CardElement):
         default=None, metadata=utils.get_metadata("1.0")
     )
     select_action: Optional[actions.SelectAction] = field(
-        default=None, metadata=utils.get_metadata("1.1")
+        default=None, metadata=utils.get_metadata("1.1", decoder=_decode_select_action)
     )
     size: Optional[ct.ImageSize] = field(
         default=None, metadata=utils.get_metadata("1.0")
@@ -132,33 +138,8 @@ class Image(CardElement):
     width: Optional[str] = field(default=None, metadata=utils.get_metadata("1.1"))
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass(kw_only=True)
-class Media(CardElement):
-    """
-    Represents a media card element.
-
-    Inherits from CardElement.
-
-    Attributes:
-        type: The type of the card element.
-        sources: The list of media sources.
-        poster: The poster image URL.
-        alt_text: The alternative text for the media.
-        caption_sources: The list of caption sources.
-    """
-
-    type: str = field(default="Media", metadata=utils.get_metadata("1.1"))
-    sources: list["MediaSource"] = field(metadata=utils.get_metadata("1.1"))
-    poster: Optional[str] = field(default=None, metadata=utils.get_metadata("1.1"))
-    alt_text: Optional[str] = field(default=None, metadata=utils.get_metadata("1.1"))
-    caption_sources: Optional[list["CaptionSource"]] = field(
-        default=None, metadata=utils.get_metadata("1.6")
-    )
-
-
-@dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass(kw_only=True)
+@dataclass_json(letter_case=utils.camel_case)
+@dataclass(kw_only=True, slots=True)
 class MediaSource:
     """
     Represents a media source.
@@ -172,8 +153,8 @@ class MediaSource:
     mime_type: Optional[str] = field(default=None, metadata=utils.get_metadata("1.1"))
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass(kw_only=True)
+@dataclass_json(letter_case=utils.camel_case)
+@dataclass(kw_only=True, slots=True)
 class CaptionSource:
     """
     Represents a caption source.
@@ -189,30 +170,33 @@ class CaptionSource:
     label: str = field(metadata=utils.get_metadata("1.6"))
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
+@dataclass_json(letter_case=utils.camel_case)
 @dataclass(kw_only=True)
-class RichTextBlock(CardElement):
+class Media(CardElement):
     """
-    Represents a rich text block.
+    Represents a media card element.
 
     Inherits from CardElement.
 
     Attributes:
-        inlines: A list of inlines in the rich text block. Each inline can be a string
-        or a TextRun object.
-        type: The type of the rich text block.
-        horizontal_alignment: The horizontal alignment of the rich text block.
+        type: The type of the card element.
+        sources: The list of media sources.
+        poster: The poster image URL.
+        alt_text: The alternative text for the media.
+        caption_sources: The list of caption sources.
     """
 
-    inlines: list[Union[str, "TextRun"]] = field(metadata=utils.get_metadata("1.2"))
-    type: str = field(default="RichTextBlock", metadata=utils.get_metadata("1.2"))
-    horizontal_alignment: Optional[ct.HorizontalAlignment] = field(
-        default=None, metadata=utils.get_metadata("1.2")
+    type: str = field(default="Media", metadata=utils.get_metadata("1.1"))
+    sources: list[MediaSource] = field(metadata=utils.get_metadata("1.1"))
+    poster: Optional[str] = field(default=None, metadata=utils.get_metadata("1.1"))
+    alt_text: Optional[str] = field(default=None, metadata=utils.get_metadata("1.1"))
+    caption_sources: Optional[list[CaptionSource]] = field(
+        default=None, metadata=utils.get_metadata("1.6")
     )
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass(kw_only=True)
+@dataclass_json(letter_case=utils.camel_case)
+@dataclass(kw_only=True, slots=True)
 class TextRun:
     # pylint: disable=too-many-instance-attributes
     """
@@ -243,7 +227,7 @@ class TextRun:
     is_subtle: Optional[bool] = field(default=None, metadata=utils.get_metadata("1.2"))
     italic: Optional[bool] = field(default=None, metadata=utils.get_metadata("1.2"))
     select_action: Optional[actions.SelectAction] = field(
-        default=None, metadata=utils.get_metadata("1.2")
+        default=None, metadata=utils.get_metadata("1.2", decoder=_decode_select_action)
     )
     size: Optional[ct.FontSize] = field(
         default=None, metadata=utils.get_metadata("1.2")
@@ -255,3 +239,31 @@ class TextRun:
     weight: Optional[ct.FontWeight] = field(
         default=None, metadata=utils.get_metadata("1.2")
     )
+
+
+@dataclass_json(letter_case=utils.camel_case)
+@dataclass(kw_only=True)
+class RichTextBlock(CardElement):
+    """
+    Represents a rich text block.
+
+    Inherits from CardElement.
+
+    Attributes:
+        inlines: A list of inlines in the rich text block. Each inline can be a string
+        or a TextRun object.
+        type: The type of the rich text block.
+        horizontal_alignment: The horizontal alignment of the rich text block.
+    """
+
+    inlines: list[Union[str, TextRun]] = field(
+        metadata=utils.get_metadata("1.2", decoder=_decode_inlines)
+    )
+    type: str = field(default="RichTextBlock", metadata=utils.get_metadata("1.2"))
+    horizontal_alignment: Optional[ct.HorizontalAlignment] = field(
+        default=None, metadata=utils.get_metadata("1.2")
+    )
+
+
+# The union type is defined once all of its classes are (see `actions.ActionTypes`).
+Element = Union[Image, TextBlock, Media, CaptionSource, RichTextBlock]
@@ -1,23 +1,22 @@
 """Implementations for adaptive card input types"""
 
 from dataclasses import dataclass, field
-from typing import Union, Optional
-from dataclasses_json import dataclass_json, LetterCase
+from typing import Any, Union, Optional
+from dataclasses_json import dataclass_json
 from adaptive_cards import utils
 import adaptive_cards.card_types as ct
 from adaptive_cards import actions
 
-InputTypes = Union[
-    "InputText",
-    "InputNumber",
-    "InputDate",
-    "InputTime",
-    "InputToggle",
-    "InputChoiceSet",
-]
+
+def _decode_input(value: Any) -> Any:
+    return utils.decode_tagged(value, InputTypes)
+
+
+def _decode_select_action(value: Any) -> Any:
+    return utils.decode_tagged(value, actions.SelectAction)
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
+@dataclass_json(letter_case=utils.camel_case)
 @dataclass(kw_only=True)
 class Input:
     # pylint: disable=too-many-instance-attributes
@@ -43,8 +42,8 @@ class Input:
         default=None, metadata=utils.get_metadata("1.3")
     )
     label: Optional[bool] = field(default=None, metadata=utils.get_metadata("1.3"))
-    fallback: Optional[InputTypes] = field(
-        default=None, metadata=utils.get_metadata("1.2")
+    fallback: Optional["InputTypes"] = field(
+        default=None, metadata=utils.get_metadata("1.2", decoder=_decode_input)
     )
     height: Optional[ct.BlockElementHeight] = field(
         default=None, metadata=utils.get_metadata("1.1")
@@ -59,7 +58,7 @@ class Input:
     )
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
+@dataclass_json(letter_case=utils.camel_case)
 @dataclass(kw_only=True)
 class InputText(Input):
     # pylint: disable=too-many-instance-attributes
@@ -92,12 +91,12 @@ class InputText(Input):
         default=None, metadata=utils.get_metadata("1.0")
     )
     inline_action: Optional[actions.SelectAction] = field(
-        default=None, metadata=utils.get_metadata("1.2")
+        default=None, metadata=utils.get_metadata("1.2", decoder=_decode_select_action)
     )
     value: Optional[str] = field(default=None, metadata=utils.get_metadata("1.0"))
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
+@dataclass_json(letter_case=utils.camel_case)
 @dataclass(kw_only=True)
 class InputNumber(Input):
     """
@@ -122,7 +121,7 @@ class InputNumber(Input):
     value: Optional[int] = field(default=None, metadata=utils.get_metadata("1.0"))
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
+@dataclass_json(letter_case=utils.camel_case)
 @dataclass(kw_only=True)
 class InputDate(Input):
     """
@@ -145,7 +144,7 @@ class InputDate(Input):
     value: Optional[str] = field(default=None, metadata=utils.get_metadata("1.0"))
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
+@dataclass_json(letter_case=utils.camel_case)
 @dataclass(kw_only=True)
 class InputTime(Input):
     """
@@ -169,7 +168,7 @@ class InputTime(Input):
     value: Optional[str] = field(default=None, metadata=utils.get_metadata("1.0"))
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
+@dataclass_json(letter_case=utils.camel_case)
 @dataclass(kw_only=True)
 class InputToggle(Input):
     """
@@ -196,7 +195,22 @@ class InputToggle(Input):
     wrap: Optional[bool] = field(default=None, metadata=utils.get_metadata("1.2"))
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
+@dataclass_json(letter_case=utils.camel_case)
+@dataclass(kw_only=True, slots=True)
+class InputChoice:
+    """
+    Represents a choice within an input choice set.
+
+    Attributes:
+        title: The title or display text of the choice.
+        value: The value associated with the choice.
+    """
+
+    title: str = field(metadata=utils.get_metadata("1.0"))
+    value: str = field(metadata=utils.get_metadata("1.0"))
+
+
+@dataclass_json(letter_case=utils.camel_case)
 @dataclass(kw_only=True)
 class InputChoiceSet(Input):
     # pylint: disable=too-many-instance-attributes
@@ -218,7 +232,7 @@ class InputChoiceSet(Input):
 
     id: str = field(metadata=utils.get_metadata("1.0"))  # pylint: disable=C0103
     type: str = field(default="Input.ChoiceSet", metadata=utils.get_metadata("1.0"))
-    choices: Optional[list["InputChoice"]] = field(
+    choices: Optional[list[InputChoice]] = field(
         default=None, metadata=utils.get_metadata("1.0")
     )
     is_multi_select: Optional[bool] = field(
@@ -232,16 +246,12 @@ class InputChoiceSet(Input):
     wrap: Optional[bool] = field(default=None, metadata=utils.get_metadata("1.2"))
 
 
-@dataclass_json(letter_case=LetterCase.CAMEL)
-@dataclass(kw_only=True)
-class InputChoice:
-    """
-    Represents a choice within an input choice set.
-
-    Attributes:
-        title: The title or display text of the choice.
-        value: The value associated with the choice.
-    """
-
-    title: str = field(metadata=utils.get_metadata("1.0"))
-    value: str = field(metadata=utils.get_metadata("1.0"))
+# The union type is defined once all of its classes are (see `actions.ActionTypes`).
+InputTypes = Union[
+    InputText,
+    InputNumber,
+    InputDate,
+    InputTime,
+    InputToggle,
+    InputChoiceSet,
+]
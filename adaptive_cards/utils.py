@@ -2,9 +2,28 @@
 Utility functions for library
 """
 
-from typing import Any
+import copy
+import dataclasses
+import functools
+import typing
+from collections.abc import Collection
+from enum import Enum
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
 
-from dataclasses_json import config
+from dataclasses_json import LetterCase, config, global_config
+
+FieldPlan = tuple[
+    str, Any, str, bool, Callable[[Any], bool] | None, Callable[[Any], Any] | None
+]
+"""
+Name, type, serialized key, whether None is skipped, exclude predicate and encoder
+of a dataclass field
+"""
+
+_ATOMIC_TYPES: frozenset[type] = frozenset({str, int, float, bool, type(None)})
+
+_SERIALIZERS: dict[type, Callable[[Any], Any]] = {}
 
 
 def is_none(item: Any) -> bool:
@@ -20,15 +39,253 @@ def is_none(item: Any) -> bool:
     return item is None
 
 
-def get_metadata(min_version: str, field_name: str | None = None) -> dict[str, Any]:
+@functools.cache
+def camel_case(name: str) -> str:
+    """
+    Convert a field name into camel case, like `LetterCase.CAMEL` does.
+
+    `dataclasses_json` converts the names of all fields again for every object it
+    encodes or decodes, therefore the results are cached.
+
+    Args:
+        name (str): Field name
+
+    Returns:
+        str: Field name in camel case
+    """
+    return LetterCase.CAMEL(name)
+
+
+@functools.cache
+def get_metadata(
+    min_version: str,
+    field_name: str | None = None,
+    decoder: Callable[[Any], Any] | None = None,
+) -> Mapping[str, Any]:
     """
     Get default metadata information for dataclass field
 
+    The result is cached, so all fields sharing the same minimum version (and field
+    name) reference the very same metadata object. It is therefore read-only.
+
     Args:
         min_version (str): Minimum version number of the field the result will
                            be appliead to.
+        field_name (str | None): Name of the field used for (de)serialization,
+                                 if it differs from the attribute name.
+        decoder (Callable[[Any], Any] | None): Custom decoder for the field value.
 
     Returns:
-        dict[str, Any]: Metadata information
+        Mapping[str, Any]: Metadata information
     """
-    return config(exclude=is_none, field_name=field_name) | {"min_version": min_version}
+    metadata: dict[str, Any] = config(
+        exclude=is_none, field_name=field_name, decoder=decoder
+    )
+    metadata["dataclasses_json"] = MappingProxyType(metadata["dataclasses_json"])
+    return MappingProxyType(metadata | {"min_version": min_version})
+
+
+@functools.cache
+def _get_tags(unions: tuple[Any, ...]) -> dict[str, type]:
+    """
+    Map the `type` tags of all components of the given unions to their classes
+
+    Args:
+        unions (tuple[Any, ...]): Union types or single component classes
+
+    Returns:
+        dict[str, type]: Component classes by tag
+    """
+    tags: dict[str, type] = {}
+    for union in unions:
+        for cls in typing.get_args(union) or (union,):
+            if not dataclasses.is_dataclass(cls):
+                continue
+            type_field: dataclasses.Field | None = cls.__dataclass_fields__.get("type")
+            if type_field is not None and isinstance(type_field.default, str):
+                tags[type_field.default] = cls
+
+    return tags
+
+
+def decode_tagged(value: Any, *unions: Any) -> Any:
+    """
+    Decode one or multiple serialized components, which are part of the given
+    unions. The class of each component is looked up by its `type` tag instead
+    of trying to decode it as every single member of the unions.
+
+    Values, which are no serialized components, like strings or already
+    decoded objects, are returned as is.
+
+    Args:
+        value (Any): Serialized component or list of serialized components
+        *unions (Any): Union types or single component classes
+
+    Returns:
+        Any: Decoded component or list of decoded components
+    """
+    tags: dict[str, type] = _get_tags(unions)
+    if type(value) is list:  # pylint: disable=C0123
+        return [_decode_tagged_item(item, tags) for item in value]
+
+    return _decode_tagged_item(value, tags)
+
+
+def _decode_tagged_item(item: Any, tags: dict[str, type]) -> Any:
+    if type(item) is not dict:  # pylint: disable=C0123
+        return item
+
+    cls: type | None = tags.get(item.get("type"))
+    if cls is None:
+        return item
+
+    return cls.from_dict(item)
+
+
+@functools.cache
+def _get_fields_plan(cls: type) -> tuple[FieldPlan, ...] | None:
+    """
+    Collect everything needed for serializing the fields of a dataclass, as
+    configured via `dataclasses_json` on class and field level. Since this is
+    static for a class, it is done only once instead of for every instance.
+    Encoders of the global configuration may still change, hence they are not part
+    of the plan.
+
+    Args:
+        cls (type): Dataclass type
+
+    Raises:
+        ValueError: If multiple fields map to the same key
+
+    Returns:
+        tuple[FieldPlan, ...] | None: Plan for each field, None if the class
+                                      handles undefined parameters.
+    """
+    class_config: Mapping[str, Any] = getattr(cls, "dataclass_json_config", None) or {}
+    if "undefined" in class_config:
+        return None
+
+    plan: list[FieldPlan] = []
+    keys: set[str] = set()
+    for field in dataclasses.fields(cls):
+        field_config: dict[str, Any] = {}
+        field_config.update(class_config)
+        field_config.update(field.metadata.get("dataclasses_json", {}))
+
+        letter_case: Callable[[str], str] | None = field_config.get("letter_case")
+        key: str = letter_case(field.name) if letter_case is not None else field.name
+        if key in keys:
+            raise ValueError(
+                f"Multiple fields map to the same JSON key after letter case "
+                f"encoding: {key}"
+            )
+        keys.add(key)
+        exclude: Callable[[Any], bool] | None = field_config.get("exclude")
+        plan.append(
+            (
+                field.name,
+                field.type,
+                key,
+                exclude is is_none,
+                exclude,
+                field_config.get("encoder"),
+            )
+        )
+
+    return tuple(plan)
+
+
+def serialize(item: Any) -> Any:
+    """
+    Convert a component and all its children into plain dictionaries and lists.
+
+    The result is the same as the one of `to_dict()` provided by `dataclasses_json`,
+    but the field configuration is evaluated only once per class. The way an item
+    is serialized is looked up by its exact type, which is resolved only once per
+    type as well. Encoders of the global configuration are looked up on every call,
+    so they apply no matter when they are registered.
+
+    Args:
+        item (Any): Item to be serialized
+
+    Returns:
+        Any: Serialized item
+    """
+    item_type: type = type(item)
+    serializer: Callable[[Any], Any] | None = _SERIALIZERS.get(item_type)
+    if serializer is None:
+        serializer = _SERIALIZERS[item_type] = _get_serializer(item_type)
+
+    return serializer(item)
+
+
+def _get_serializer(item_type: type) -> Callable[[Any], Any]:
+    """
+    Resolve how items of the given type are serialized
+
+    Args:
+        item_type (type): Type of the items
+
+    Returns:
+        Callable[[Any], Any]: Serializer for items of the type
+    """
+    if item_type is list:
+        return _serialize_collection
+
+    if item_type in _ATOMIC_TYPES or issubclass(item_type, Enum):
+        # enum members are immutable singletons, a deep copy returns them as is
+        return _serialize_as_is
+
+    if dataclasses.is_dataclass(item_type):
+        fields_plan: tuple[FieldPlan, ...] | None = _get_fields_plan(item_type)
+        if fields_plan is None:
+            return item_type.to_dict
+
+        return functools.partial(_serialize_fields, fields_plan)
+
+    if issubclass(item_type, Mapping):
+        return _serialize_mapping
+
+    if issubclass(item_type, Collection) and not issubclass(
+        item_type, (str, bytes, Enum)
+    ):
+        return _serialize_collection
+
+    return _serialize_copy
+
+
+def _serialize_as_is(item: Any) -> Any:
+    encoder: Callable[[Any], Any] | None = global_config.encoders.get(type(item))
+    return item if encoder is None else encoder(item)
+
+
+def _serialize_copy(item: Any) -> Any:
+    encoder: Callable[[Any], Any] | None = global_config.encoders.get(type(item))
+    return copy.deepcopy(item) if encoder is None else encoder(item)
+
+
+def _serialize_collection(item: Collection) -> list[Any]:
+    return [serialize(value) for value in item]
+
+
+def _serialize_mapping(item: Mapping) -> dict[Any, Any]:
+    return {serialize(key): serialize(value) for key, value in item.items()}
+
+
+def _serialize_fields(fields_plan: tuple[FieldPlan, ...], item: Any) -> dict[str, Any]:
+    result: dict[str, Any] = {}
+    for name, field_type, key, skip_none, exclude, encoder in fields_plan:
+        value: Any = getattr(item, name)
+        if value is None and skip_none:
+            # Unset optional fields are the common case, skip them without
+            # serializing the value and calling the exclude predicate
+            continue
+        if encoder is None:
+            encoder = global_config.encoders.get(field_type)
+        if encoder is None:
+            value = serialize(value)
+        if exclude is not None and exclude(value):
+            continue
+        result[key] = value if encoder is None else encoder(value)
+
+    return result
@@ -1,15 +1,19 @@
 """Validation class for evaluating a cards schema"""
 
+import copy
 import dataclasses
+import functools
 import json
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, fields
 from enum import Enum, Flag
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Callable, Literal
 
-from jsonschema.exceptions import ValidationError
-from jsonschema.validators import Draft6Validator
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
 
 from adaptive_cards.card import AdaptiveCard
 
@@ -18,6 +22,120 @@ MINIMUM_VERSION_KEY: str = "min_version"
 SchemaVersion = Literal["1.0", "1.1", "1.2", "1.3", "1.4", "1.5", "1.6"]
 
 
+@functools.cache
+def _is_list_type(cls: type) -> bool:
+    """
+    Check whether a given type is a list or a subclass of it. Results are cached per
+    type, like for `_is_dataclass_type`.
+
+    Args:
+        cls (type): Type to be checked
+
+    Returns:
+        bool: true if type is a list
+    """
+    return issubclass(cls, list)
+
+
+@functools.cache
+def _is_dataclass_type(cls: type) -> bool:
+    """
+    Check whether a given type is a dataclass. Results are cached per type, since
+    only a handful of distinct types occur while traversing a card.
+
+    Args:
+        cls (type): Type to be checked
+
+    Returns:
+        bool: true if type is a dataclass
+    """
+    return dataclasses.is_dataclass(cls)
+
+
+@functools.cache
+def _field_versions(cls: type) -> tuple[tuple[str, Any], ...]:
+    """
+    Get name and minimum version of all fields of a dataclass. The table is built
+    once per type instead of reading the field metadata for every item.
+
+    Args:
+        cls (type): Dataclass type
+
+    Returns:
+        tuple[tuple[str, Any], ...]: Pairs of field name and minimum version
+    """
+    return tuple(
+        (field.name, field.metadata.get(MINIMUM_VERSION_KEY)) for field in fields(cls)
+    )
+
+
+@functools.cache
+def _read_schema_file(schema_version: SchemaVersion) -> dict[str, Any]:
+    """
+    Read the official card schema for a given version. The schema is read only once
+    per version and shared, hence it must not be modified.
+
+    Args:
+        schema_version (SchemaVersion): Version of the schema
+
+    Returns:
+        dict[str, Any]: Card schema
+    """
+    with open(
+        Path(__file__)
+        .parent.joinpath("schemas")
+        .joinpath(f"schema-{schema_version}.json"),
+        "r",
+        encoding="utf-8",
+    ) as f:  # pylint: disable=C0103
+        return json.load(f)
+
+
+@functools.cache
+def _compile_schema(schema_version: SchemaVersion) -> Callable[[Any], Any]:
+    """
+    Compile the official card schema for a given version into a validation function
+    using `fastjsonschema`. Compiling takes a moment, hence the result is cached and
+    shared by all validators.
+
+    Like the default validator, formats are not checked and no defaults are
+    inserted into the validated data. The schema is compiled from a copy, since
+    `fastjsonschema` modifies it in place while resolving references.
+
+    Args:
+        schema_version (SchemaVersion): Version of the schema
+
+    Returns:
+        Callable[[Any], Any]: Validation function raising on schema violations
+    """
+    return fastjsonschema.compile(
+        copy.deepcopy(_read_schema_file(schema_version)),
+        use_default=False,
+        use_formats=False,
+    )
+
+
+@functools.cache
+def _get_schema_validator(schema_version: SchemaVersion) -> Any:
+    """
+    Create a `jsonschema` validator for the official card schema of a given version.
+    The validator is created once per version and shared by all card validators, so
+    references within the schema are resolved only once.
+
+    Args:
+        schema_version (SchemaVersion): Version of the schema
+
+    Returns:
+        Any: Validator for the card schema
+    """
+    # importing jsonschema takes a considerable amount of time, hence it is
+    # deferred until a schema is validated with it for the first time
+    # pylint: disable=import-outside-toplevel
+    from jsonschema.validators import Draft6Validator
+
+    return Draft6Validator(_read_schema_file(schema_version))
+
+
 class Result(Flag):
     """
     Represents the overall validation result value as a combination of flags.
@@ -371,9 +489,10 @@ class CardValidator(AbstractCardValidator):
         self.__schema_version: SchemaVersion = target_framework.schema_version()
 
         self.__card: AdaptiveCard
+        self.__card_json: str
         self.__item: Any
-        self.__findings: list[Finding]
-        self.__card_size: float
+        self.__findings: list[Finding] = []
+        self.__card_size: float = 0
 
     def validate(self, card: AdaptiveCard, debug: bool = True) -> Result:
         self.__card = card
@@ -397,6 +516,9 @@ class CardValidator(AbstractCardValidator):
         self.__card_size: float = 0
 
     def __validate_card(self) -> None:
+        # serialize the card only once, both the schema and the size check need it
+        self.__card_json = self.__card.to_json()
+
         # check whether card body is empty or not
         self.__validate_card_body()
 
@@ -431,7 +553,8 @@ class CardValidator(AbstractCardValidator):
         Returns:
             list[Any]: One or multiple items stored as a list
         """
-        if not isinstance(items, list):
+        # the exact type check is the fast path for the common case
+        if type(items) is not list and not isinstance(items, list):  # pylint: disable=C0123
             items = [items]
 
         return items
@@ -454,23 +577,24 @@ class CardValidator(AbstractCardValidator):
 
         for item in items:
             self.__item = item
-            for field in fields(item):
-                value: Any = getattr(item, field.name)
+            for field_name, minimum_version in _field_versions(type(item)):
+                value: Any = getattr(item, field_name)
 
                 if value is None:
                     continue
 
-                if isinstance(value, list):
+                # dispatch on the exact type, which is cheaper than isinstance checks,
+                # subclasses of list are resolved once per type
+                value_type: type = type(value)
+                if value_type is list or _is_list_type(value_type):
                     iterables.append(value)
                     continue
 
-                if dataclasses.is_dataclass(value):
+                if _is_dataclass_type(value_type):
                     custom_types.append(value)
                     continue
 
-                self.__validate_field_version(
-                    field.name, field.metadata.get(MINIMUM_VERSION_KEY)
-                )
+                self.__validate_field_version(field_name, minimum_version)
 
         for iterable in iterables:
             self.__validate_version_for_elements(iterable)
@@ -480,11 +604,14 @@ class CardValidator(AbstractCardValidator):
 
     @staticmethod
     def __calculate_card_size(card: AdaptiveCard) -> float:
-        json_string: bytes = card.to_json().encode("utf-8")
-        return len(json_string) / 1024
+        return CardValidator.__calculate_json_size(card.to_json())
+
+    @staticmethod
+    def __calculate_json_size(json_string: str) -> float:
+        return len(json_string.encode("utf-8")) / 1024
 
     def __validate_card_size(self) -> None:
-        self.__card_size = CardValidator.__calculate_card_size(self.__card)
+        self.__card_size = CardValidator.__calculate_json_size(self.__card_json)
         if self.__card_size > self.__target_framework.max_card_size():
             self.__findings.append(
                 Finding(
@@ -508,29 +635,37 @@ class CardValidator(AbstractCardValidator):
                 )
             )
 
-    def __read_schema_file(self) -> dict[str, Any]:
-        with open(
-            Path(__file__)
-            .parent.joinpath("schemas")
-            .joinpath(f"schema-{self.__schema_version}.json"),
-            "r",
-            encoding="utf-8",
-        ) as f:  # pylint: disable=C0103
-            return json.load(f)
-
     def __validate_schema(self) -> None:
-        schema: dict[str, Any] = self.__read_schema_file()
+        card: Any = json.loads(self.__card_json)
+
+        # prefer the compiled schema, if the optional dependency is available
+        if fastjsonschema is not None:
+            try:
+                _compile_schema(self.__schema_version)(card)
+
+            except fastjsonschema.JsonSchemaValueException as ex:
+                self.__add_schema_finding(ex.message)
+            return
+
+        validator: Any = _get_schema_validator(self.__schema_version)
+        # jsonschema is loaded by now, see _get_schema_validator
+        # pylint: disable=import-outside-toplevel
+        from jsonschema.exceptions import ValidationError
+
         try:
-            Draft6Validator(schema).validate(json.loads(self.__card.to_json()))
+            validator.validate(card)
 
         except ValidationError as ex:
-            self.__findings.append(
-                Finding(
-                    ValidationFailure.INVALID_SCHEMA,
-                    ValidationFailure.INVALID_SCHEMA.value,
-                    f"{ex.message}",
-                )
+            self.__add_schema_finding(ex.message)
+
+    def __add_schema_finding(self, message: str) -> None:
+        self.__findings.append(
+            Finding(
+                ValidationFailure.INVALID_SCHEMA,
+                ValidationFailure.INVALID_SCHEMA.value,
+                f"{message}",
             )
+        )
 
     def __debug(self):
         for finding in self.__findings:
@@ -0,0 +1,179 @@
+"""Tests for card module"""
+
+import json
+import unittest
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest import mock
+from uuid import UUID
+
+from dataclasses_json import DataClassJsonMixin, global_config
+
+import adaptive_cards.card_types as types
+from adaptive_cards import card as card_module
+from adaptive_cards import (
+    ActionExecute,
+    ActionOpenUrl,
+    ActionShowCard,
+    ActionSubmit,
+    AdaptiveCard,
+    Container,
+    InputText,
+    RichTextBlock,
+    TextBlock,
+    TextRun,
+)
+
+
+class TestAdaptiveCardSerialization(unittest.TestCase):
+    """Test class for Adaptive Card serialization"""
+
+    def setUp(self) -> None:
+        self.card: AdaptiveCard = (
+            AdaptiveCard.new()
+            .version("1.5")
+            .add_item(TextBlock(text="Test Card", color=types.Colors.GOOD))
+            .add_action(ActionOpenUrl(url="https://adaptivecards.io"))
+            .create()
+        )
+
+    def test_to_dict(self) -> None:
+        """Test dictionary export matches the one of dataclasses_json"""
+        self.assertEqual(self.card.to_dict(), DataClassJsonMixin.to_dict(self.card))
+        self.assertNotIn("selectAction", self.card.to_dict())
+        self.assertIn("$schema", self.card.to_dict())
+
+    def test_to_dict_global_encoders(self) -> None:
+        """Test global encoders apply even if registered after a first export"""
+        self.card.to_dict()
+        global_config.encoders[str] = str.upper
+        global_config.encoders[types.Colors] = str
+        try:
+            self.assertEqual(self.card.to_dict(), DataClassJsonMixin.to_dict(self.card))
+            self.assertEqual(self.card.to_dict()["body"][0]["text"], "TEST CARD")
+        finally:
+            del global_config.encoders[str]
+            del global_config.encoders[types.Colors]
+
+    def test_to_dict_enum_members(self) -> None:
+        """Test enum members are exported as they are"""
+        self.assertIs(self.card.to_dict()["body"][0]["color"], types.Colors.GOOD)
+        self.assertEqual(json.loads(self.card.to_json())["body"][0]["color"], "good")
+
+    def test_to_json_bytes(self) -> None:
+        """Test bytes export matches the json string export"""
+        json_bytes: bytes = self.card.to_json_bytes()
+        self.assertIsInstance(json_bytes, bytes)
+        self.assertEqual(json.loads(json_bytes), json.loads(self.card.to_json()))
+
+    def test_to_json_bytes_submit_data(self) -> None:
+        """Test bytes export encodes arbitrary submit data like the json export"""
+        card: AdaptiveCard = (
+            AdaptiveCard.new()
+            .add_action(
+                ActionSubmit(
+                    data={1: "id", "sent": datetime(2024, 1, 1, tzinfo=timezone.utc)}
+                )
+            )
+            .create()
+        )
+        self.assertEqual(json.loads(card.to_json_bytes()), json.loads(card.to_json()))
+
+    def test_to_json_bytes_extended_types(self) -> None:
+        """Test bytes export encodes extended types like the json export"""
+        card: AdaptiveCard = (
+            AdaptiveCard.new()
+            .add_action(
+                ActionSubmit(
+                    data={
+                        "amount": Decimal("1.50"),
+                        "id": UUID("12345678-1234-5678-1234-567812345678"),
+                        "tags": {"a"},
+                    }
+                )
+            )
+            .create()
+        )
+        self.assertEqual(json.loads(card.to_json_bytes()), json.loads(card.to_json()))
+
+    def test_to_json_bytes_big_int(self) -> None:
+        """Test bytes export encodes integers beyond 64 bit like the json export"""
+        card: AdaptiveCard = (
+            AdaptiveCard.new().add_action(ActionSubmit(data={"id": 2**64})).create()
+        )
+        self.assertEqual(
+            card.to_json_bytes(), card.to_json(separators=(",", ":")).encode("utf-8")
+        )
+
+    def test_to_json_bytes_without_orjson(self) -> None:
+        """Test bytes export falls back to the json export without orjson"""
+        with mock.patch.object(card_module, "orjson", None):
+            json_bytes: bytes = self.card.to_json_bytes()
+        self.assertEqual(
+            json_bytes, self.card.to_json(separators=(",", ":")).encode("utf-8")
+        )
+        self.assertEqual(json.loads(json_bytes), json.loads(self.card.to_json()))
+
+    def test_schema(self) -> None:
+        """Test the marshmallow schema of the card is available"""
+        dumped: dict = AdaptiveCard.schema().dump(self.card)
+        self.assertEqual(dumped["$schema"], self.card.schema)
+        self.assertEqual(dumped["version"], "1.5")
+        self.assertEqual(dumped["body"][0]["text"], "Test Card")
+
+    def test_from_json(self) -> None:
+        """Test card can be restored from its json export"""
+        card: AdaptiveCard = AdaptiveCard.from_json(self.card.to_json())
+        self.assertEqual(card, self.card)
+
+    def test_from_json_component_types(self) -> None:
+        """Test components are restored by their type"""
+        card: AdaptiveCard = (
+            AdaptiveCard.new()
+            .version("1.5")
+            .add_item(InputText(id="input"))
+            .add_item(RichTextBlock(inlines=["Test", TextRun(text="Card")]))
+            .add_item(
+                Container(
+                    items=[TextBlock(text="Test Card")],
+                    select_action=ActionExecute(verb="test"),
+                )
+            )
+            .add_action(ActionShowCard(title="Test"))
+            .create()
+        )
+        restored: AdaptiveCard = AdaptiveCard.from_json(card.to_json())
+        self.assertEqual(restored, card)
+        self.assertIsInstance(restored.body[0], InputText)
+        self.assertIsInstance(restored.body[2].select_action, ActionExecute)
+
+
+class TestAdaptiveCardBuilder(unittest.TestCase):
+    """Test class for Adaptive Card builder"""
+
+    def test_add_items_and_actions(self) -> None:
+        """Test multiple items and actions are appended in order"""
+        items: list[TextBlock] = [TextBlock(text="1"), TextBlock(text="2")]
+        actions: list[ActionOpenUrl] = [ActionOpenUrl(url="1"), ActionOpenUrl(url="2")]
+        card: AdaptiveCard = (
+            AdaptiveCard.new()
+            .add_item(TextBlock(text="0"))
+            .add_items(items)
+            .add_actions(actions)
+            .add_action(ActionOpenUrl(url="3"))
+            .create()
+        )
+        self.assertEqual([item.text for item in card.body], ["0", "1", "2"])
+        self.assertEqual([action.url for action in card.actions], ["1", "2", "3"])
+
+    def test_create_resets_builder(self) -> None:
+        """Test builder can be reused without changing created cards"""
+        builder = AdaptiveCard.new()
+        card: AdaptiveCard = builder.add_item(TextBlock(text="1")).create()
+        other: AdaptiveCard = builder.add_item(TextBlock(text="2")).create()
+        self.assertEqual([item.text for item in card.body], ["1"])
+        self.assertEqual([item.text for item in other.body], ["2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
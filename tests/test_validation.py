@@ -2,6 +2,7 @@
 
 import unittest
 from dataclasses import dataclass, field
+from unittest import mock
 
 from dataclasses_json import dataclass_json
 
@@ -11,6 +12,7 @@ from adaptive_cards import (
     TextBlock,
     utils,
 )
+from adaptive_cards import validation
 from adaptive_cards.validation import (
     CardValidator,
     CardValidatorFactory,
@@ -18,6 +20,11 @@ from adaptive_cards.validation import (
     ValidationFailure,
 )
 
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
 
 class TestAdaptiveCardValidation(unittest.TestCase):
     """Test class for Adaptive Card validaiton"""
@@ -33,6 +40,13 @@ class TestAdaptiveCardValidation(unittest.TestCase):
         self.assertEqual(validator.validate(card), Result.SUCCESS)
         self.assertEqual(len(validator.details()), 0)
 
+    def test_details_without_validation(self) -> None:
+        """Test validators don't share findings and start without any"""
+        validator: CardValidator = CardValidatorFactory.create_validator_bot()
+        other: CardValidator = CardValidatorFactory.create_validator_bot()
+        self.assertEqual(len(validator.details()), 0)
+        self.assertIsNot(validator.details(), other.details())
+
     def test_validate_failure_empty_body(self) -> None:
         """Test validation for ms teams"""
         validator: CardValidator = (
@@ -60,6 +74,25 @@ class TestAdaptiveCardValidation(unittest.TestCase):
             validator.details()[0].failure, ValidationFailure.INVALID_FIELD_VERSION
         )
 
+    def test_validate_failure_invalid_field_version_list_subclass(self) -> None:
+        """Test validation of elements held in a subclass of list"""
+        validator: CardValidator = (
+            CardValidatorFactory.create_validator_microsoft_teams()
+        )
+
+        class ItemList(list):
+            """List subclass"""
+
+        card: AdaptiveCard = AdaptiveCard.new().version("1.0").create()
+        card.body = ItemList(
+            [TextBlock(text="Test Card", font_type=types.FontType.MONOSPACE)]
+        )
+        self.assertEqual(validator.validate(card), Result.FAILURE)
+        self.assertEqual(len(validator.details()), 1)
+        self.assertEqual(
+            validator.details()[0].failure, ValidationFailure.INVALID_FIELD_VERSION
+        )
+
     def test_validate_failure_invalid_schema(self) -> None:
         """Test validation for ms teams"""
         validator: CardValidator = (
@@ -114,5 +147,44 @@ class TestAdaptiveCardValidation(unittest.TestCase):
         )
 
 
+class TestAdaptiveCardSchemaBackends(unittest.TestCase):
+    """Test class for the schema validation backends"""
+
+    def setUp(self) -> None:
+        self.valid_card: AdaptiveCard = (
+            AdaptiveCard.new().add_item(TextBlock(text="Test Card")).create()
+        )
+        text_block: TextBlock = TextBlock(text="Test Card")
+        text_block.max_lines = "a"
+        self.invalid_card: AdaptiveCard = (
+            AdaptiveCard.new().add_item(text_block).create()
+        )
+
+    def assert_schema_validation(self) -> None:
+        """Assert the results for a valid and a schema-invalid card"""
+        validator: CardValidator = (
+            CardValidatorFactory.create_validator_microsoft_teams()
+        )
+        self.assertEqual(validator.validate(self.valid_card), Result.SUCCESS)
+        self.assertEqual(len(validator.details()), 0)
+
+        self.assertEqual(validator.validate(self.invalid_card), Result.FAILURE)
+        self.assertEqual(len(validator.details()), 1)
+        self.assertEqual(
+            validator.details()[0].failure, ValidationFailure.INVALID_SCHEMA
+        )
+
+    def test_validate_jsonschema(self) -> None:
+        """Test schema validation without fastjsonschema installed"""
+        with mock.patch.object(validation, "fastjsonschema", None):
+            self.assert_schema_validation()
+
+    @unittest.skipIf(fastjsonschema is None, "fastjsonschema is not installed")
+    def test_validate_fastjsonschema(self) -> None:
+        """Test schema validation with fastjsonschema installed"""
+        with mock.patch.object(validation, "fastjsonschema", fastjsonschema):
+            self.assert_schema_validation()
+
+
 if __name__ == "__main__":
     unittest.main()